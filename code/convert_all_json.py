@@ -5,16 +5,46 @@ Batch JSON to HTML Converter for IMO25 Solution Files
 This script converts all JSON solution files in the run_logs directory to HTML format.
 """
 
-import os
-import glob
+import argparse
 from pathlib import Path
-from json_to_html_converter import convert_json_to_html
+from json_to_html_converter import (
+    STATIC_ASSET_NAMES,
+    convert_files,
+    find_json_files,
+    write_static_assets,
+)
+
+
+def is_up_to_date(json_file):
+    """Check whether the converted HTML for json_file is newer than the JSON.
+
+    A page also counts as stale when the shared stylesheet or script it links
+    to is missing from its directory.
+    """
+    json_path = Path(json_file)
+    html_path = json_path.with_name(f"{json_path.stem}_converted.html")
+    try:
+        if html_path.stat().st_mtime < json_path.stat().st_mtime:
+            return False
+    except FileNotFoundError:
+        return False
+    return all(html_path.with_name(name).is_file() for name in STATIC_ASSET_NAMES)
 
 
 def main():
     """Convert all JSON files in the run_logs directory."""
+    parser = argparse.ArgumentParser(
+        description="Convert all JSON files in the run_logs directory to HTML."
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="reconvert files even if their HTML output is already up to date",
+    )
+    args = parser.parse_args()
+
     # Find all JSON files in run_logs
-    json_files = glob.glob("../run_logs/*.json")
+    json_files = find_json_files("../run_logs")
 
     if not json_files:
         print("No JSON files found in run_logs directory")
@@ -24,22 +54,45 @@ def main():
     for file in json_files:
         print(f"  - {file}")
 
+    # Skip files whose HTML output is newer than the JSON input
+    skipped = 0
+    if not args.force:
+        pending = [
+            json_file for json_file in json_files if not is_up_to_date(json_file)
+        ]
+        skipped = len(json_files) - len(pending)
+        json_files = pending
+        if skipped:
+            print(f"\nSkipping {skipped} up-to-date files (use --force to reconvert)")
+        if not json_files:
+            # The pages are current, but the shared assets may still be from
+            # an older converter
+            try:
+                write_static_assets(Path("../run_logs"))
+            except OSError as e:
+                print(f"Error writing shared assets: {e}")
+            print("All HTML files are up to date")
+            return
+
     print("\nStarting conversion...")
 
-    # Convert each file
-    successful = 0
-    failed = 0
+    # Convert files in parallel; each worker writes its own output file
+    results = convert_files(json_files)
+
+    print(
+        "\n".join(
+            f"\nConverting {json_file}...\n{log}".rstrip()
+            for json_file, _, log in results
+        )
+    )
 
-    for json_file in json_files:
-        print(f"\nConverting {json_file}...")
-        if convert_json_to_html(json_file):
-            successful += 1
-        else:
-            failed += 1
+    successful = sum(1 for _, ok, _ in results if ok)
+    failed = len(results) - successful
 
     print(f"\nConversion completed!")
     print(f"Successful: {successful}")
     print(f"Failed: {failed}")
+    print(f"Skipped: {skipped}")
 
     if successful > 0:
         print(f"\nHTML files have been created in the run_logs directory.")
@@ -6,169 +6,377 @@ This program converts the large JSON solution files to readable HTML format,
 making it easier to analyze the solutions and verification results.
 """
 
-import json
+import io
+import mmap
 import os
+import re
 import sys
-from datetime import datetime
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from functools import lru_cache
+from itertools import repeat
+from html import escape as html_escape
 from pathlib import Path
 import markdown
 
+# Pick the fastest available JSON parser once at import time. orjson takes the
+# raw UTF-8 bytes, the others are fed decoded text.
+try:
+    from orjson import loads as _json_loads
+
+    _JSON_BINARY = True
+except ImportError:
+    try:
+        from ujson import loads as _json_loads
+    except ImportError:
+        from json import loads as _json_loads
+    _JSON_BINARY = False
+
+# ijson is optional; without it every file is loaded in full
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Fields read by the HTML sections; everything else is dropped after loading.
+# Run and iteration fields are always present afterwards, filled in with these
+# defaults, so the section builders can index them directly. The run and
+# iteration numbers default to their position in the log.
+_METADATA_KEYS = ("problem_statement", "timestamp", "model_name")
+_RUN_DEFAULTS = {"timestamp": "", "status": "unknown", "reason": ""}
+_ITERATION_DEFAULTS = {
+    "correct_count": 0,
+    "error_count": 0,
+    "verification_result": "unknown",
+    "is_correct": False,
+}
+_VERIFICATION_KEYS = ("bug_report",)
+
+# Files larger than this are streamed run by run instead of loaded in full
+_STREAMING_THRESHOLD = 50_000_000
+
+# Shared markdown renderer; building one loads every extension and compiles its
+# patterns, so reuse it and reset() its per-document state between conversions
+_MD = markdown.Markdown(extensions=["extra", "codehilite", "sane_lists", "nl2br"])
+
+# Shared empty default for missing iteration lists
+_EMPTY = ()
+
+# Output buffer size used when writing converted HTML files
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+def _esc(value):
+    """HTML-escape a JSON value, rendering non-strings such as null as text."""
+    return html_escape(value if isinstance(value, str) else str(value))
+
+
+# Status badge markup: CSS class and upper-cased label
+_STATUS_BADGE = '<span class="status {}">{}</span>'
+
+
+def _status_badge(css_class, label):
+    """Build a status badge for a label not covered by the prebuilt tables."""
+    return _STATUS_BADGE.format(css_class, _esc(str(label).upper()))
+
+
+# Prebuilt badges for the run statuses agent.py writes, and for the usual
+# verification results keyed by (is_correct, verification_result)
+_RUN_STATUS_HTML = {
+    status: _status_badge("failed" if status == "failed" else "success", status)
+    for status in ("success", "failed", "error", "unknown")
+}
+_VERIFICATION_HTML = {
+    (is_correct, result): _status_badge("success" if is_correct else "failed", result)
+    for is_correct in (True, False)
+    for result in ("yes", "no", "Yes", "No", "unknown")
+}
+
+# Newline directly followed by an asterisk; markdown needs a blank line there
+# to start a list
+_LIST_ITEM_RE = re.compile(r"\n(?=\*)")
+
+# Anything markdown (with the extensions above) could treat specially: inline
+# markup and escapes, raw HTML and entities, block markers at the start of a
+# line, leading/trailing whitespace on a line, and control characters such as
+# tabs and carriage returns that markdown normalises. Text without any of these
+# is rendered by _md_to_html without the markdown pipeline.
+_MD_SYNTAX_RE = re.compile(
+    r"[*_#>\[\]`\\<&|~{}\x00-\x09\x0b-\x1f]|^[^\S\n]|[^\S\n]$|^[-+=:]|^\d+[.)]",
+    re.MULTILINE,
+)
+
+# Blank lines separating paragraphs in plain text
+_PARAGRAPH_BREAK_RE = re.compile(r"\n{2,}")
+
+# Other ISO-8601 shapes, in extended (2025-08-01T12:34) or basic (20250801T1234)
+# form: date, then optionally hours, minutes, seconds, a fraction and a UTC
+# offset. The offset is dropped; like the fast path, the local time is shown.
+_TIMESTAMP_FALLBACK_RE = re.compile(
+    r"(\d{4})(-?)(\d{2})\2(\d{2})"
+    r"(?:[T ](\d{2})(?:(:?)(\d{2})(?:\6(\d{2})(?:[.,]\d+)?)?)?)?"
+    r"(?:Z|[+-]\d{2}(?::?\d{2})?)?"
+)
+
 
 def load_json_file(file_path):
     """Load and parse a JSON file."""
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        if ijson is not None and os.path.getsize(file_path) > _STREAMING_THRESHOLD:
+            return load_summary(file_path)
+        if _JSON_BINARY:
+            # Map the file and let orjson parse the mapped pages directly,
+            # which avoids copying the whole file into a bytes object first
+            with open(file_path, "rb") as f, mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_READ
+            ) as mm, memoryview(mm) as view:
+                data = _json_loads(view)
+        else:
+            with open(file_path, "r", encoding="utf-8") as f:
+                data = _json_loads(f.read())
+        return _project(data)
     except Exception as e:
         print(f"Error loading {file_path}: {e}")
         return None
 
 
+def _pick(mapping, keys):
+    """Return the subset of mapping restricted to the given keys."""
+    return {key: mapping[key] for key in keys if key in mapping}
+
+
+def _project_iteration(iteration, index):
+    """Strip an iteration down to the fields the HTML reads, with defaults."""
+    get = iteration.get
+    projected = {"iteration": get("iteration", index)}
+    for key, default in _ITERATION_DEFAULTS.items():
+        projected[key] = get(key, default)
+    if "corrected_solution" in iteration:
+        projected["corrected_solution"] = iteration["corrected_solution"]
+    if "verification" in iteration:
+        projected["verification"] = _pick(iteration["verification"], _VERIFICATION_KEYS)
+    return projected
+
+
+def _project_run(run, index):
+    """Strip a run down to the fields the HTML reads, with defaults."""
+    get = run.get
+    projected = {"run_number": get("run_number", index)}
+    for key, default in _RUN_DEFAULTS.items():
+        projected[key] = get(key, default)
+    projected["iterations"] = [
+        _project_iteration(iteration, i)
+        for i, iteration in enumerate(get("iterations") or _EMPTY)
+    ]
+    return projected
+
+
+def _project(data):
+    """Drop the fields of a loaded log that the HTML never shows.
+
+    Prompts, initial explorations and the final solution can make up most of a
+    log; releasing them right after parsing keeps them out of peak memory.
+    """
+    if not data or not isinstance(data, dict):
+        return data
+    return {
+        "metadata": _pick(data.get("metadata", {}), _METADATA_KEYS),
+        "runs": [
+            _project_run(run, i) for i, run in enumerate(data.get("runs") or _EMPTY)
+        ],
+    }
+
+
+class _RunStream:
+    """Re-iterable view of the runs in a JSON file, parsed one run at a time."""
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+
+    def __iter__(self):
+        with open(self.file_path, "rb") as f:
+            runs = ijson.items(f, "runs.item", use_float=True)
+            for i, run in enumerate(runs):
+                yield _project_run(run, i)
+
+
+def load_summary(file_path):
+    """Load the metadata of a large JSON file and stream its runs lazily.
+
+    Only one run is held in memory at a time; the runs are re-parsed for each
+    pass (statistics, then the run sections) instead of keeping them all.
+    """
+    with open(file_path, "rb") as f:
+        metadata = next(ijson.items(f, "metadata", use_float=True), {})
+    return {
+        "metadata": _pick(metadata, _METADATA_KEYS),
+        "runs": _RunStream(file_path),
+    }
+
+
 def format_timestamp(timestamp_str):
     """Format timestamp string for display."""
     try:
-        dt = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-        return dt.strftime("%Y-%m-%d %H:%M:%S")
+        # ISO-8601 input down to seconds only needs slicing, so check the
+        # separator positions and skip parsing entirely
+        ts = timestamp_str
+        if (
+            len(ts) >= 19
+            and ts[4] == ts[7] == "-"
+            and ts[10] in "T "
+            and ts[13] == ts[16] == ":"
+        ):
+            return ts[:10] + " " + ts[11:19]
+        match = _TIMESTAMP_FALLBACK_RE.fullmatch(ts)
+        if match:
+            year, _, month, day, hour, _, minute, second = match.groups("00")
+            # strptime rejects out-of-range fields such as month 13
+            parsed = time.strptime(
+                f"{year}-{month}-{day} {hour}:{minute}:{second}", "%Y-%m-%d %H:%M:%S"
+            )
+            return time.strftime("%Y-%m-%d %H:%M:%S", parsed)
     except:
-        return timestamp_str
+        pass
+    return timestamp_str
 
 
-def create_html_header(title):
-    """Create the HTML header with CSS styling."""
-    return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
-    <style>
-        body {{
+# Shared stylesheet and script written once next to the converted HTML files,
+# so each page links to them instead of repeating several KB of inline markup.
+_STYLESHEET_NAME = "imo25.css"
+_SCRIPT_NAME = "imo25.js"
+STATIC_ASSET_NAMES = (_STYLESHEET_NAME, _SCRIPT_NAME)
+
+# Static pieces of the HTML header. Only the title varies between files, so the
+# large CSS block is built once at import time instead of in an f-string per call.
+_CSS_BLOCK = """
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             line-height: 1.6;
             margin: 0;
             padding: 20px;
             background-color: #f5f5f5;
-        }}
-        .container {{
+        }
+        .container {
             max-width: 1200px;
             margin: 0 auto;
             background-color: white;
             padding: 30px;
             border-radius: 10px;
             box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
-        h1 {{
+        }
+        h1 {
             color: #2c3e50;
             border-bottom: 3px solid #3498db;
             padding-bottom: 10px;
             margin-bottom: 30px;
-        }}
-        h2 {{
+        }
+        h2 {
             color: #34495e;
             border-left: 4px solid #3498db;
             padding-left: 15px;
             margin-top: 30px;
-        }}
-        h3 {{
+        }
+        h3 {
             color: #2c3e50;
             margin-top: 25px;
-        }}
-        .metadata {{
+        }
+        .metadata {
             background-color: #ecf0f1;
             padding: 20px;
             border-radius: 8px;
             margin-bottom: 30px;
-        }}
-        .metadata-grid {{
+        }
+        .metadata-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
             gap: 15px;
-        }}
-        .metadata-item {{
+        }
+        .metadata-item {
             background-color: white;
             padding: 15px;
             border-radius: 6px;
             border-left: 4px solid #3498db;
-        }}
-        .metadata-label {{
+        }
+        .metadata-label {
             font-weight: bold;
             color: #2c3e50;
             margin-bottom: 5px;
-        }}
-        .metadata-value {{
+        }
+        .metadata-value {
             color: #34495e;
-        }}
-        .run {{
+        }
+        .run {
             border: 2px solid #bdc3c7;
             border-radius: 8px;
             margin: 20px 0;
             overflow: hidden;
-        }}
-        .run-header {{
+        }
+        .run-header {
             background-color: #34495e;
             color: white;
             padding: 15px;
             cursor: pointer;
             user-select: none;
-        }}
-        .run-header:hover {{
+        }
+        .run-header:hover {
             background-color: #2c3e50;
-        }}
-        .run-content {{
+        }
+        .run-content {
             padding: 20px;
             display: none;
-        }}
-        .run-content.expanded {{
+        }
+        .run-content.expanded {
             display: block;
-        }}
-        .status {{
+        }
+        .status {
             display: inline-block;
             padding: 5px 12px;
             border-radius: 20px;
             font-weight: bold;
             font-size: 0.9em;
             margin-left: 15px;
-        }}
-        .status.failed {{
+        }
+        .status.failed {
             background-color: #e74c3c;
             color: white;
-        }}
-        .status.success {{
+        }
+        .status.success {
             background-color: #27ae60;
             color: white;
-        }}
-        .iteration {{
+        }
+        .iteration {
             border: 1px solid #ddd;
             border-radius: 6px;
             margin: 15px 0;
             padding: 15px;
-        }}
-        .iteration-header {{
+        }
+        .iteration-header {
             background-color: #f8f9fa;
             padding: 10px;
             border-radius: 4px;
             margin-bottom: 15px;
-        }}
-        .verification {{
+        }
+        .verification {
             background-color: #fff3cd;
             border: 1px solid #ffeaa7;
             border-radius: 6px;
             padding: 15px;
             margin-top: 15px;
-        }}
-        .verification-header {{
+        }
+        .verification-header {
             font-weight: bold;
             color: #856404;
             margin-bottom: 10px;
-        }}
-        .bug-report {{
+        }
+        .bug-report {
             background-color: white;
             border: 1px solid white;
             border-radius: 6px;
             padding: 15px;
             margin-top: 10px;
-        }}
-        .solution-text {{
+        }
+        .solution-text {
             background-color: #f8f9fa;
             border: 1px solid #dee2e6;
             border-radius: 6px;
@@ -179,8 +387,8 @@ def create_html_header(title):
             font-size: 0.9em;
             max-height: 400px;
             overflow-y: auto;
-        }}
-        .toggle-btn {{
+        }
+        .toggle-btn {
             background-color: #3498db;
             color: white;
             border: none;
@@ -188,31 +396,31 @@ def create_html_header(title):
             border-radius: 4px;
             cursor: pointer;
             margin: 10px 0;
-        }}
-        .toggle-btn:hover {{
+        }
+        .toggle-btn:hover {
             background-color: #2980b9;
-        }}
-        .stats {{
+        }
+        .stats {
             display: flex;
             gap: 20px;
             margin: 20px 0;
             flex-wrap: wrap;
-        }}
-        .stat-item {{
+        }
+        .stat-item {
             background-color: #e8f4fd;
             padding: 10px 15px;
             border-radius: 6px;
             border-left: 4px solid #3498db;
-        }}
-        .stat-label {{
+        }
+        .stat-label {
             font-weight: bold;
             color: #2c3e50;
-        }}
-        .stat-value {{
+        }
+        .stat-value {
             color: #34495e;
             font-size: 1.2em;
-        }}
-        .problem-statement {{
+        }
+        .problem-statement {
             background-color: white;
             border: 1px solid #f5c6cb;
             border-radius: 6px;
@@ -220,170 +428,170 @@ def create_html_header(title):
             margin: 20px 0;
             font-family: 'Georgia', serif;
             line-height: 1.8;
-        }}
+        }
         
         /* Problem statement markdown styling */
-        .problem-statement h1, .problem-statement h2, .problem-statement h3, .problem-statement h4, .problem-statement h5, .problem-statement h6 {{
+        .problem-statement h1, .problem-statement h2, .problem-statement h3, .problem-statement h4, .problem-statement h5, .problem-statement h6 {
             color: #2c3e50;
             margin-top: 1.5em;
             margin-bottom: 0.5em;
-        }}
+        }
         
-        .problem-statement h1 {{
+        .problem-statement h1 {
             font-size: 1.5em;
             border-bottom: 2px solid #e74c3c;
             padding-bottom: 0.3em;
-        }}
+        }
         
-        .problem-statement h2 {{
+        .problem-statement h2 {
             font-size: 1.3em;
             border-bottom: 1px solid #f5c6cb;
             padding-bottom: 0.2em;
-        }}
+        }
         
-        .problem-statement h3 {{
+        .problem-statement h3 {
             font-size: 1.1em;
-        }}
+        }
         
-        .problem-statement strong {{
+        .problem-statement strong {
             color: #2c3e50;
             font-weight: 600;
-        }}
+        }
         
-        .problem-statement em {{
+        .problem-statement em {
             color: #34495e;
             font-style: italic;
-        }}
+        }
         
-        .problem-statement ul, .problem-statement ol {{
+        .problem-statement ul, .problem-statement ol {
             margin: 1em 0;
             padding-left: 2em;
-        }}
+        }
         
-        .problem-statement li {{
+        .problem-statement li {
             margin: 0.3em 0;
-        }}
+        }
         
-        .problem-statement code {{
+        .problem-statement code {
             background-color: #f8f9fa;
             border: 1px solid #e9ecef;
             border-radius: 3px;
             padding: 0.2em 0.4em;
             font-family: 'Courier New', monospace;
             font-size: 0.9em;
-        }}
+        }
         
-        .problem-statement pre {{
+        .problem-statement pre {
             background-color: #f8f9fa;
             border: 1px solid #e9ecef;
             border-radius: 6px;
             padding: 1em;
             overflow-x: auto;
-        }}
+        }
         
-        .problem-statement pre code {{
+        .problem-statement pre code {
             background: none;
             border: none;
             padding: 0;
-        }}
+        }
         
-        .problem-statement blockquote {{
+        .problem-statement blockquote {
             border-left: 4px solid #e74c3c;
             margin: 1em 0;
             padding-left: 1em;
             color: #7f8c8d;
             font-style: italic;
-        }}
+        }
         
         /* Markdown styling */
-        .solution-text h1, .solution-text h2, .solution-text h3, .solution-text h4, .solution-text h5, .solution-text h6 {{
+        .solution-text h1, .solution-text h2, .solution-text h3, .solution-text h4, .solution-text h5, .solution-text h6 {
             color: #2c3e50;
             margin-top: 1.5em;
             margin-bottom: 0.5em;
-        }}
+        }
         
-        .solution-text h1 {{
+        .solution-text h1 {
             font-size: 1.5em;
             border-bottom: 2px solid #3498db;
             padding-bottom: 0.3em;
-        }}
+        }
         
-        .solution-text h2 {{
+        .solution-text h2 {
             font-size: 1.3em;
             border-bottom: 1px solid #bdc3c7;
             padding-bottom: 0.2em;
-        }}
+        }
         
-        .solution-text h3 {{
+        .solution-text h3 {
             font-size: 1.1em;
-        }}
+        }
         
-        .solution-text strong {{
+        .solution-text strong {
             color: #2c3e50;
             font-weight: 600;
-        }}
+        }
         
-        .solution-text em {{
+        .solution-text em {
             color: #34495e;
             font-style: italic;
-        }}
+        }
         
-        .solution-text ul, .solution-text ol {{
+        .solution-text ul, .solution-text ol {
             margin: 1em 0;
             padding-left: 2em;
-        }}
+        }
         
-        .solution-text li {{
+        .solution-text li {
             margin: 0.3em 0;
-        }}
+        }
         
-        .solution-text code {{
+        .solution-text code {
             background-color: #f8f9fa;
             border: 1px solid #e9ecef;
             border-radius: 3px;
             padding: 0.2em 0.4em;
             font-family: 'Courier New', monospace;
             font-size: 0.9em;
-        }}
+        }
         
-        .solution-text pre {{
+        .solution-text pre {
             background-color: #f8f9fa;
             border: 1px solid #e9ecef;
             border-radius: 6px;
             padding: 1em;
             overflow-x: auto;
-        }}
+        }
         
-        .solution-text pre code {{
+        .solution-text pre code {
             background: none;
             border: none;
             padding: 0;
-        }}
+        }
         
-        .solution-text blockquote {{
+        .solution-text blockquote {
             border-left: 4px solid #3498db;
             margin: 1em 0;
             padding-left: 1em;
             color: #7f8c8d;
             font-style: italic;
-        }}
+        }
         
         /* MathJax styling */
-        .MathJax {{
+        .MathJax {
             font-size: 1.1em;
-        }}
+        }
         
         /* Ensure proper spacing around math */
-        .math-content {{
+        .math-content {
             line-height: 1.8;
-        }}
+        }
         
-        .math-content p {{
+        .math-content p {
             margin: 1em 0;
-        }}
+        }
         
         /* Better formatting for mathematical content */
-        .solution-text {{
+        .solution-text {
             background-color: #f8f9fa;
             border: 1px solid #dee2e6;
             border-radius: 6px;
@@ -395,49 +603,66 @@ def create_html_header(title):
             max-height: 400px;
             overflow-y: auto;
             line-height: 1.8;
-        }}
+        }
         
-        @media (max-width: 768px) {{
-            .container {{
+        @media (max-width: 768px) {
+            .container {
                 padding: 15px;
-            }}
-            .metadata-grid {{
+            }
+            .metadata-grid {
                 grid-template-columns: 1fr;
-            }}
-            .stats {{
+            }
+            .stats {
                 flex-direction: column;
-            }}
-        }}
-    </style>
+            }
+        }
+    """
+
+_HTML_PREFIX = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>"""
+
+_HEAD_MID = (
+    f"""</title>
+    <link rel="stylesheet" href="{_STYLESHEET_NAME}">"""
+    + """
     
     <!-- MathJax Configuration -->
     <script>
-        window.MathJax = {{
-            tex: {{
+        window.MathJax = {
+            tex: {
                 inlineMath: [['$', '$'], ['\\\\(', '\\\\)']],
                 displayMath: [['$$', '$$'], ['\\\\[', '\\\\]']],
                 processEscapes: true,
                 processEnvironments: true
-            }},
-            options: {{
+            },
+            options: {
                 ignoreHtmlClass: 'tex2jax_ignore',
                 processHtmlClass: 'tex2jax_process'
-            }}
-        }};
+            }
+        };
     </script>
     <script type="text/javascript" id="MathJax-script" async
         src="https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-mml-chtml.js"></script>
 </head>
 <body>
     <div class="container">
-        <h1>{title}</h1>"""
+        <h1>"""
+)
 
+_HEAD_SUFFIX = "</h1>"
 
-def create_html_footer():
-    """Create the HTML footer with JavaScript."""
-    return """
-    </div>
-    <script>
+
+def create_html_header(title):
+    """Create the HTML header with CSS styling."""
+    title = html_escape(title)
+    return _HTML_PREFIX + title + _HEAD_MID + title + _HEAD_SUFFIX
+
+
+_SCRIPT_BLOCK = """
         // Toggle run content visibility
         document.querySelectorAll('.run-header').forEach(header => {
             header.addEventListener('click', function() {
@@ -472,11 +697,92 @@ def create_html_footer():
                 });
             }
         });
-    </script>
+    """
+
+
+def _minify_css(css):
+    """Strip comments and insignificant whitespace from a stylesheet.
+
+    A space before a colon is only dropped inside declaration blocks; in a
+    selector such as ".a :hover" it is a descendant combinator.
+    """
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r" ?([{};,]) ?", r"\1", css).replace(": ", ":")
+    css = re.sub(r"\{[^{}]*\}", lambda block: block[0].replace(" :", ":"), css)
+    return css.strip()
+
+
+def _minify_js(js):
+    """Strip whole-line // comments and collapse whitespace in a script.
+
+    Only suitable for scripts that terminate every statement with a semicolon,
+    since newlines are not kept for automatic semicolon insertion.
+    """
+    js = re.sub(r"^\s*//.*$", "", js, flags=re.M)
+    return re.sub(r"\s+", " ", js).strip()
+
+
+# The stylesheet and script as written to disk; the readable sources above are
+# what to edit
+_CSS_MIN = _minify_css(_CSS_BLOCK)
+_SCRIPT_MIN = _minify_js(_SCRIPT_BLOCK)
+
+_HTML_FOOTER = f"""
+    </div>
+    <script src="{_SCRIPT_NAME}"></script>
 </body>
 </html>"""
 
 
+def write_static_assets(output_dir):
+    """Write the shared stylesheet and script into output_dir if they are stale."""
+    for name, content in (
+        (_STYLESHEET_NAME, _CSS_MIN),
+        (_SCRIPT_NAME, _SCRIPT_MIN),
+    ):
+        path = output_dir / name
+        try:
+            if path.read_text(encoding="utf-8") == content:
+                continue
+        except FileNotFoundError:
+            pass
+        # Write to a temporary file first so concurrent conversions never see a
+        # partially written asset
+        tmp_path = path.with_name(f"{name}.{os.getpid()}.tmp")
+        try:
+            tmp_path.write_text(content, encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+
+def create_html_footer():
+    """Create the HTML footer with JavaScript."""
+    return _HTML_FOOTER
+
+
+@lru_cache(maxsize=512)
+def _md_to_html(text):
+    """Convert markdown text to HTML, memoizing texts repeated across iterations."""
+    if not _MD_SYNTAX_RE.search(text):
+        # Nothing for markdown to interpret: emit the paragraphs and line
+        # breaks it would produce without running the block parser
+        paragraphs = _PARAGRAPH_BREAK_RE.split(text.strip("\n"))
+        return "\n".join(
+            "<p>" + paragraph.replace("\n", "<br />\n") + "</p>"
+            for paragraph in paragraphs
+            if paragraph
+        )
+    # Ensure proper spacing for list items - fix newline + asterisk spacing
+    text = _LIST_ITEM_RE.sub("\n\n", text)
+    return _MD.reset().convert(text)
+
+
 def format_problem_statement(statement):
     """Format the problem statement for display."""
     if not statement:
@@ -486,206 +792,170 @@ def format_problem_statement(statement):
     cleaned = statement.replace("*** Problem Statement ***\n\n", "")
     cleaned = cleaned.strip()
 
-    # Ensure proper spacing for list items - fix newline + asterisk spacing
-    cleaned = cleaned.replace("\n*", "\n\n*")
-
     # Convert markdown to HTML
-    return markdown.markdown(
-        cleaned, extensions=["extra", "codehilite", "sane_lists", "nl2br"]
-    )
+    return _md_to_html(cleaned)
 
 
-def create_metadata_section(data):
-    """Create the metadata section of the HTML."""
+def create_metadata_section(data, write):
+    """Write the metadata section of the HTML using the given write callable."""
     metadata = data.get("metadata", {})
 
-    html = '<div class="metadata">'
-    html += "<h2>Problem Information</h2>"
-    html += '<div class="metadata-grid">'
+    write('<div class="metadata">')
+    write("<h2>Problem Information</h2>")
+    write('<div class="metadata-grid">')
 
     # Problem statement
     if "problem_statement" in metadata:
-        html += f"""
+        write(f"""
         <div class="metadata-item">
             <div class="metadata-label">Problem Statement</div>
             <div class="problem-statement">{format_problem_statement(metadata['problem_statement'])}</div>
-        </div>"""
+        </div>""")
 
     # Basic metadata
     if "timestamp" in metadata:
-        html += f"""
+        write(f"""
         <div class="metadata-item">
             <div class="metadata-label">Timestamp</div>
-            <div class="metadata-value">{format_timestamp(metadata['timestamp'])}</div>
-        </div>"""
+            <div class="metadata-value">{_esc(format_timestamp(metadata['timestamp']))}</div>
+        </div>""")
 
     if "model_name" in metadata:
-        html += f"""
+        write(f"""
         <div class="metadata-item">
             <div class="metadata-label">Model</div>
-            <div class="metadata-value">{metadata['model_name']}</div>
-        </div>"""
+            <div class="metadata-value">{_esc(metadata['model_name'])}</div>
+        </div>""")
 
-    html += "</div></div>"
-    return html
+    write("</div></div>")
 
 
-def create_run_section(run_data, run_index):
-    """Create HTML for a single run."""
-    run_number = run_data.get("run_number", run_index)
-    timestamp = format_timestamp(run_data.get("timestamp", ""))
-    status = run_data.get("status", "unknown")
-    reason = run_data.get("reason", "")
+def create_run_section(run_data, write):
+    """Write the HTML for a single run using the given write callable."""
+    run_number = _esc(run_data["run_number"])
+    timestamp = _esc(format_timestamp(run_data["timestamp"]))
+    status = run_data["status"]
+    reason = run_data["reason"]
 
-    status_class = "failed" if status == "failed" else "success"
-    status_text = status.upper()
+    status_badge = _RUN_STATUS_HTML.get(status) or _status_badge(
+        "failed" if status == "failed" else "success", status
+    )
 
-    html = f"""
+    write(f"""
         <div class="run">
             <div class="run-header">
                 <strong>Run {run_number}</strong>
-                <span class="status {status_class}">{status_text}</span>
+                {status_badge}
                 <small style="float: right;">{timestamp}</small>
             </div>
-            <div class="run-content">"""
+            <div class="run-content">""")
 
     if reason:
-        html += f"<p><strong>Reason:</strong> {reason}</p>"
+        reason_html = _esc(reason).replace("\n", "<br>")
+        write(f"<p><strong>Reason:</strong> {reason_html}</p>")
 
     # Iterations
-    iterations = run_data.get("iterations", [])
+    iterations = run_data["iterations"]
     if iterations:
-        html += f"<h3>Iterations ({len(iterations)})</h3>"
+        write(f"<h3>Iterations ({len(iterations)})</h3>")
+
+        for iteration in iterations:
+            create_iteration_section(iteration, write)
 
-        for i, iteration in enumerate(iterations):
-            html += create_iteration_section(iteration, i)
+    write("</div></div>")
 
-    html += "</div></div>"
-    return html
 
+def create_iteration_section(iteration, write):
+    """Write the HTML for a single iteration using the given write callable."""
+    iteration_num = _esc(iteration["iteration"])
+    correct_count = _esc(iteration["correct_count"])
+    error_count = _esc(iteration["error_count"])
+    verification_result = iteration["verification_result"]
+    is_correct = iteration["is_correct"]
 
-def create_iteration_section(iteration, index):
-    """Create HTML for a single iteration."""
-    iteration_num = iteration.get("iteration", index)
-    correct_count = iteration.get("correct_count", 0)
-    error_count = iteration.get("error_count", 0)
-    verification_result = iteration.get("verification_result", "unknown")
-    is_correct = iteration.get("is_correct", False)
+    status_badge = _VERIFICATION_HTML.get(
+        (is_correct, verification_result)
+    ) or _status_badge("success" if is_correct else "failed", verification_result)
 
-    html = f"""
+    write(f"""
         <div class="iteration">
             <div class="iteration-header">
                 <strong>Iteration {iteration_num}</strong>
-                <span class="status {"success" if is_correct else "failed"}">
-                    {verification_result.upper()}
-                </span>
+                {status_badge}
                 <small style="margin-left: 15px;">
                     Correct: {correct_count}, Errors: {error_count}
                 </small>
-            </div>"""
+            </div>""")
 
     # Solution text
     if "corrected_solution" in iteration:
-        html += """
+        write("""
             <button class="toggle-btn">Show Solution</button>
-            <div class="solution-text">"""
-        # Pre-process to ensure proper list item spacing
-        solution_text = iteration["corrected_solution"].replace("\n*", "\n\n*")
-
+            <div class="solution-text">""")
         # Convert markdown to HTML
-        solution_html = markdown.markdown(
-            solution_text,
-            extensions=["extra", "codehilite", "sane_lists", "nl2br"],
-        )
-        html += solution_html
-        html += "</div>"
+        solution_html = _md_to_html(iteration["corrected_solution"])
+        write(solution_html)
+        write("</div>")
 
     # Verification details
     if "verification" in iteration:
         verification = iteration["verification"]
-        html += '<div class="verification">'
-        html += '<div class="verification-header">Verification Results</div>'
+        write('<div class="verification">')
+        write('<div class="verification-header">Verification Results</div>')
 
         if "bug_report" in verification:
-            html += '<div class="bug-report">'
-            html += f"<strong>Bug Report:</strong><br>"
-            # Pre-process to ensure proper list item spacing
-            bug_report_text = verification["bug_report"].replace("\n*", "\n\n*")
-
+            write('<div class="bug-report">')
+            write("<strong>Bug Report:</strong><br>")
             # Convert markdown to HTML
-            bug_report_html = markdown.markdown(
-                bug_report_text,
-                extensions=["extra", "codehilite", "sane_lists", "nl2br"],
-            )
-            html += bug_report_html
-            html += "</div>"
+            bug_report_html = _md_to_html(verification["bug_report"])
+            write(bug_report_html)
+            write("</div>")
 
-        html += "</div>"
+        write("</div>")
 
-    html += "</div>"
-    return html
+    write("</div>")
 
 
-def create_stats_section(data):
-    """Create a statistics summary section."""
+def create_stats_section(data, write):
+    """Write a statistics summary section using the given write callable."""
     runs = data.get("runs", [])
-    total_runs = len(runs)
-    failed_runs = sum(1 for run in runs if run.get("status") == "failed")
+
+    # Gather every counter in a single pass over the runs and their iterations
+    total_runs = 0
+    failed_runs = 0
+    total_iterations = 0
+    total_correct = 0
+    total_errors = 0
+    for run in runs:
+        total_runs += 1
+        if run["status"] == "failed":
+            failed_runs += 1
+        iterations = run["iterations"]
+        total_iterations += len(iterations)
+        for iteration in iterations:
+            total_correct += iteration["correct_count"]
+            total_errors += iteration["error_count"]
     successful_runs = total_runs - failed_runs
 
-    total_iterations = sum(len(run.get("iterations", [])) for run in runs)
-    total_correct = sum(
-        sum(iter.get("correct_count", 0) for iter in run.get("iterations", []))
-        for run in runs
-    )
-    total_errors = sum(
-        sum(iter.get("error_count", 0) for iter in run.get("iterations", []))
-        for run in runs
+    stats = (
+        ("Total Runs", total_runs),
+        ("Successful Runs", successful_runs),
+        ("Failed Runs", failed_runs),
+        ("Total Iterations", total_iterations),
+        ("Total Correct", total_correct),
+        ("Total Errors", total_errors),
     )
 
-    html = (
-        """
-        <div class="stats">
-            <div class="stat-item">
-                <div class="stat-label">Total Runs</div>
-                <div class="stat-value">"""
-        + str(total_runs)
-        + """</div>
-            </div>
-            <div class="stat-item">
-                <div class="stat-label">Successful Runs</div>
-                <div class="stat-value">"""
-        + str(successful_runs)
-        + """</div>
-            </div>
-            <div class="stat-item">
-                <div class="stat-label">Failed Runs</div>
-                <div class="stat-value">"""
-        + str(failed_runs)
-        + """</div>
-            </div>
-            <div class="stat-item">
-                <div class="stat-label">Total Iterations</div>
-                <div class="stat-value">"""
-        + str(total_iterations)
-        + """</div>
-            </div>
-            <div class="stat-item">
-                <div class="stat-label">Total Correct</div>
-                <div class="stat-value">"""
-        + str(total_correct)
-        + """</div>
-            </div>
+    write("""
+        <div class="stats">""")
+    for label, value in stats:
+        write(f"""
             <div class="stat-item">
-                <div class="stat-label">Total Errors</div>
-                <div class="stat-value">"""
-        + str(total_errors)
-        + """</div>
-            </div>
-        </div>"""
-    )
-
-    return html
+                <div class="stat-label">{label}</div>
+                <div class="stat-value">{value}</div>
+            </div>""")
+    write("""
+        </div>""")
 
 
 def convert_json_to_html(json_file_path, output_dir=None):
@@ -695,58 +965,120 @@ def convert_json_to_html(json_file_path, output_dir=None):
     if not data:
         return False
 
+    json_path = Path(json_file_path)
+    input_filename = json_path.stem
+
     # Determine output path
     if output_dir is None:
         # If running from code directory, output to run_logs directory
         if Path.cwd().name == "code":
             output_dir = Path("../run_logs")
         else:
-            output_dir = Path(json_file_path).parent
-
-    output_dir = Path(output_dir)
-    output_dir.mkdir(exist_ok=True)
+            output_dir = json_path.parent
+    else:
+        output_dir = Path(output_dir)
 
     # Create output filename
-    input_filename = Path(json_file_path).stem
     output_filename = f"{input_filename}_converted.html"
     output_path = output_dir / output_filename
 
-    # Create HTML content
     title = f"IMO25 Solution Analysis - {input_filename.replace('_', ' ').title()}"
 
-    html_content = create_html_header(title)
-
-    # Add metadata section
-    html_content += create_metadata_section(data)
-
-    # Add statistics section
-    html_content += create_stats_section(data)
-
-    # Add runs section
-    runs = data.get("runs", [])
-    if runs:
-        html_content += "<h2>Solution Attempts</h2>"
-        for i, run in enumerate(runs):
-            html_content += create_run_section(run, i)
-
-    # Add footer
-    html_content += create_html_footer()
-
-    # Write HTML file
+    # Write HTML file, streaming each section straight to disk so the whole
+    # document never has to be held in memory. The page goes to a temporary
+    # file first, so a failure part way through keeps the previous page.
+    tmp_path = output_path.with_name(f"{output_filename}.{os.getpid()}.tmp")
     try:
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
+        output_dir.mkdir(exist_ok=True)
+        write_static_assets(output_dir)
+
+        # A 1 MiB buffer keeps multi-MB outputs to a handful of write syscalls
+        with open(
+            tmp_path, "w", encoding="utf-8", newline="", buffering=_WRITE_BUFFER_SIZE
+        ) as f:
+            write = f.write
+            write(create_html_header(title))
+
+            # Add metadata section
+            create_metadata_section(data, write)
+
+            # Add statistics section
+            create_stats_section(data, write)
+
+            # Add runs section
+            # The heading is written before the first run rather than after a
+            # truthiness test, since a streamed run list has no length
+            first = True
+            for run in data.get("runs", _EMPTY):
+                if first:
+                    write("<h2>Solution Attempts</h2>")
+                    first = False
+                create_run_section(run, write)
+
+            # Add footer
+            write(create_html_footer())
+        os.replace(tmp_path, output_path)
         print(f"Successfully converted {json_file_path} to {output_path}")
         return True
     except Exception as e:
-        print(f"Error writing HTML file: {e}")
+        if isinstance(e, OSError):
+            print(f"Error writing HTML file: {e}")
+        else:
+            print(f"Error rendering {json_file_path}: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
         return False
+    finally:
+        # Repeated texts rarely span files, so don't keep them around
+        _md_to_html.cache_clear()
+
+
+def find_json_files(directory):
+    """List the JSON files directly inside directory.
+
+    Like glob("*.json"), hidden files such as macOS "._" resource forks are
+    skipped.
+    """
+    with os.scandir(directory) as entries:
+        return [
+            entry.path
+            for entry in entries
+            if entry.name.endswith(".json")
+            and not entry.name.startswith(".")
+            and entry.is_file()
+        ]
+
+
+def convert_file(json_file, output_dir=None):
+    """Convert a single JSON file and return (path, success, log) for tallying.
+
+    Messages from the converter are captured instead of printed so parallel
+    workers don't contend for stdout; callers print them all once at the end.
+    """
+    with redirect_stdout(io.StringIO()) as log:
+        ok = convert_json_to_html(json_file, output_dir)
+    return json_file, ok, log.getvalue()
+
+
+def convert_files(json_files, output_dir=None):
+    """Convert several JSON files in parallel worker processes.
+
+    Each worker imports the converter once and reuses its markdown renderer for
+    every file it handles. Returns convert_file's (path, success, log) tuples
+    in input order.
+    """
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        return list(executor.map(convert_file, json_files, repeat(output_dir)))
 
 
 def main():
     """Main function to handle command line arguments."""
     if len(sys.argv) < 2:
-        print("Usage: python json_to_html_converter.py <json_file> [output_directory]")
+        print(
+            "Usage: python json_to_html_converter.py <json_file|directory> [output_directory]"
+        )
         print("Example: python json_to_html_converter.py ../run_logs/solution_01.json")
         return
 
@@ -757,6 +1089,18 @@ def main():
         print(f"Error: File {json_file} not found")
         return
 
+    # Directory mode: convert every JSON file in it with a worker pool
+    if os.path.isdir(json_file):
+        json_files = find_json_files(json_file)
+        if not json_files:
+            print(f"No JSON files found in {json_file}")
+            return
+        results = convert_files(json_files, output_dir)
+        print("\n".join(log.rstrip() for _, _, log in results))
+        successful = sum(1 for _, ok, _ in results if ok)
+        print(f"Converted {successful} of {len(results)} files")
+        return
+
     success = convert_json_to_html(json_file, output_dir)
     if success:
         print("Conversion completed successfully!")